@@ -1,21 +1,73 @@
+import base64
+import functools
 import json
 import sys
 from pathlib import Path
 
 from collections import deque
-from enum import Enum, auto
+
+import numpy as np
+
+try:
+    from scipy.ndimage import label
+except ImportError:  # SciPy is optional; fall back to a flood fill.
+    label = None
+
+# The Numba flood fill is only used without SciPy, so skip its import otherwise.
+njit = None
+if label is None:
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional; fall back to a Python BFS.
+        pass
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to compact stdlib JSON.
+    orjson = None
+
 from rng import RNG
 
 
-class TileType(Enum):
-    WALL = auto()
-    FLOOR = auto()
+# Tile types, stored as uint8 values in GameMap.tiles.
+WALL = 0
+FLOOR = 1
+STAIRS_DOWN = 2
+
+# Bit offsets of the four 2-bit cells in a packed tile byte.
+_PACK_SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+
+# 4-connected neighbour offsets used by the connectivity BFS.
+_NEIGHBOURS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+# Console glyph for each tile type, indexed by tile value.
+GLYPHS = np.array([ord("#"), ord("."), ord(">")], dtype=np.uint8)
 
 class GameMap:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.tiles = [[TileType.WALL for _ in range(width)] for _ in range(height)]
+        self.tiles = np.full((height, width), WALL, dtype=np.uint8)
+        # Scratch mask reused by check_map_connectivity.
+        self._visited = np.zeros((height, width), dtype=np.uint8)
+
+    def pack(self) -> bytes:
+        """Returns the tiles packed 2 bits per cell, 4 cells per byte, row-major."""
+        flat = self.tiles.ravel()
+        quads = np.zeros(-(-flat.size // 4) * 4, dtype=np.uint8)
+        quads[:flat.size] = flat
+        quads = quads.reshape(-1, 4)
+        packed = quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+        return packed.tobytes()
+
+    @classmethod
+    def unpack(cls, width: int, height: int, data: bytes) -> "GameMap":
+        """Rebuilds a map from the output of ``pack``."""
+        packed = np.frombuffer(data, dtype=np.uint8)
+        cells = (packed[:, None] >> _PACK_SHIFTS) & 0b11
+        game_map = cls(width, height)
+        game_map.tiles[:] = cells.ravel()[:width * height].reshape(height, width)
+        return game_map
 
 class Rect:
     """A rectangle on the map, used for rooms."""
@@ -24,6 +76,8 @@ class Rect:
         self.y1 = y
         self.x2 = x + w
         self.y2 = y + h
+        self.cx = (self.x1 + self.x2) // 2
+        self.cy = (self.y1 + self.y2) // 2
 
 class Player:
     def __init__(self, x: int, y: int, hp: int = 100):
@@ -44,12 +98,59 @@ class Enemy:
         self.atk = atk
         self.def_stat = def_stat
 
+class EnemyStore:
+    """Enemies kept as parallel arrays, indexed by position.
+
+    Per-type data (id, name, atk, def) lives in a small table referenced by
+    ``type_idx``. Indexing the store builds an ``Enemy`` for that slot.
+    """
+    def __init__(self, enemies: list[Enemy]):
+        count = len(enemies)
+        self.xs = np.fromiter((enemy.x for enemy in enemies), dtype=np.intp, count=count)
+        self.ys = np.fromiter((enemy.y for enemy in enemies), dtype=np.intp, count=count)
+        self.hp = np.fromiter((enemy.hp for enemy in enemies), dtype=np.int32, count=count)
+        self.type_idx = np.empty(count, dtype=np.intp)
+        self.types: list[tuple[str, str, int, int]] = []
+        self.pos_index: dict[tuple[int, int], int] = {}
+        self.count = count
+
+        type_lookup = {}
+        for i, enemy in enumerate(enemies):
+            type_i = type_lookup.get(enemy.enemy_id)
+            if type_i is None:
+                type_i = type_lookup[enemy.enemy_id] = len(self.types)
+                self.types.append((enemy.enemy_id, enemy.name, enemy.atk, enemy.def_stat))
+            self.type_idx[i] = type_i
+            self.pos_index[(enemy.x, enemy.y)] = i
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, idx: int) -> Enemy:
+        enemy_id, name, atk, def_stat = self.types[self.type_idx[idx]]
+        return Enemy(int(self.xs[idx]), int(self.ys[idx]), enemy_id, name, int(self.hp[idx]), atk, def_stat)
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+    def remove(self, enemy: Enemy):
+        """Removes the enemy at ``enemy``'s position by swapping in the last slot."""
+        idx = self.pos_index.pop((enemy.x, enemy.y))
+        last = self.count - 1
+        if idx != last:
+            self.xs[idx] = self.xs[last]
+            self.ys[idx] = self.ys[last]
+            self.hp[idx] = self.hp[last]
+            self.type_idx[idx] = self.type_idx[last]
+            self.pos_index[(int(self.xs[idx]), int(self.ys[idx]))] = idx
+        self.count = last
+
 class Engine:
     def __init__(self, rng: RNG, game_map: GameMap, player: Player, enemies: list[Enemy], enemy_types: dict):
         self.rng = rng
         self.game_map = game_map
         self.player = player
-        self.enemies = enemies
+        self.enemies = EnemyStore(enemies)
         self.enemy_types = enemy_types
         self.seed = rng.seed
 
@@ -57,13 +158,16 @@ class Engine:
         dest_x = self.player.x + dx
         dest_y = self.player.y + dy
 
-        for enemy in self.enemies:
-            if dest_x == enemy.x and dest_y == enemy.y:
-                # Combat initiated
-                run_combat(self.player, enemy, self)
-                return
+        idx = self.enemies.pos_index.get((dest_x, dest_y))
+        if idx is not None:
+            # Combat initiated
+            enemy = self.enemies[idx]
+            run_combat(self.player, enemy, self)
+            if enemy.hp > 0:
+                self.enemies.hp[idx] = enemy.hp
+            return
 
-        if self.game_map.tiles[dest_y][dest_x] == TileType.FLOOR:
+        if self.game_map.tiles[dest_y, dest_x] == FLOOR:
             self.player.x = dest_x
             self.player.y = dest_y
 
@@ -81,15 +185,32 @@ def save_game(engine: Engine, filename:str):
             "hp": engine.player.hp,
             "inventory": engine.player.inventory,
         },
+        "map": {
+            "width": engine.game_map.width,
+            "height": engine.game_map.height,
+            "tiles": base64.b64encode(engine.game_map.pack()).decode("ascii"),
+        },
         "enemies": enemies_data,
         "deltas": [],  # Not used in this implementation
     }
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=4)
-
+    if orjson is not None:
+        try:
+            Path(filename).write_bytes(orjson.dumps(data))
+            return
+        except TypeError:  # orjson only encodes 64-bit ints; seeds can be larger.
+            pass
+    Path(filename).write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+@functools.lru_cache(maxsize=None)
 def load_json(path: str):
-    with open(Path(path), "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Parses a JSON data file, once per path.
+
+    The result is shared between callers and must be treated as read-only.
+    """
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 def load_content(path="data/content.json"):
     data = load_json(path)
@@ -101,21 +222,39 @@ def load_procgen(path="data/procgen.json"):
     assert "map" in data and "depth_settings" in data
     return data
 
+Stamp = tuple[slice, slice]
+
+def _room_stamp(room: Rect) -> Stamp:
+    """Returns the (rows, cols) slices covering a room's floor."""
+    return slice(room.y1 + 1, room.y2), slice(room.x1 + 1, room.x2)
+
+def _h_tunnel_stamp(x1: int, x2: int, y: int) -> Stamp:
+    """Returns the (rows, cols) slices covering a horizontal tunnel."""
+    lo, hi = (x1, x2) if x1 < x2 else (x2, x1)
+    return slice(y, y + 1), slice(lo, hi + 1)
+
+def _v_tunnel_stamp(y1: int, y2: int, x: int) -> Stamp:
+    """Returns the (rows, cols) slices covering a vertical tunnel."""
+    lo, hi = (y1, y2) if y1 < y2 else (y2, y1)
+    return slice(lo, hi + 1), slice(x, x + 1)
+
+def _apply_stamps(game_map: GameMap, stamps: list[Stamp]):
+    """Carves every stamped rectangle into the map as floor."""
+    tiles = game_map.tiles
+    for ys, xs in stamps:
+        tiles[ys, xs] = FLOOR
+
 def _create_room(game_map: GameMap, room: Rect):
     """Carves out a rectangular room in the map."""
-    for x in range(room.x1 + 1, room.x2):
-        for y in range(room.y1 + 1, room.y2):
-            game_map.tiles[y][x] = TileType.FLOOR
+    game_map.tiles[_room_stamp(room)] = FLOOR
 
 def _create_h_tunnel(game_map: GameMap, x1: int, x2: int, y: int):
     """Carves a horizontal tunnel."""
-    for x in range(min(x1, x2), max(x1, x2) + 1):
-        game_map.tiles[y][x] = TileType.FLOOR
+    game_map.tiles[_h_tunnel_stamp(x1, x2, y)] = FLOOR
 
 def _create_v_tunnel(game_map: GameMap, y1: int, y2: int, x: int):
     """Carves a vertical tunnel."""
-    for y in range(min(y1, y2), max(y1, y2) + 1):
-        game_map.tiles[y][x] = TileType.FLOOR
+    game_map.tiles[_v_tunnel_stamp(y1, y2, x)] = FLOOR
 
 def run_combat(player: Player, enemy: Enemy, engine: Engine):
     while player.hp > 0 and enemy.hp > 0:
@@ -162,139 +301,210 @@ def run_combat(player: Player, enemy: Enemy, engine: Engine):
             print("Invalid action.")
 
 
-def render_map(game_map: GameMap, player_x: int, player_y: int, enemies: list[Enemy]):
+def render_map(game_map: GameMap, player_x: int, player_y: int, enemies: EnemyStore):
     """Renders the map to the console."""
-    for y in range(game_map.height):
-        for x in range(game_map.width):
-            if x == player_x and y == player_y:
-                print("@", end="")
-            elif any(enemy.x == x and enemy.y == y for enemy in enemies):
-                print("E", end="")
-            elif game_map.tiles[y][x] == TileType.WALL:
-                print("#", end="")
-            else:
-                print(".", end="")
-        print()
+    buf = GLYPHS[game_map.tiles]
+    count = len(enemies)
+    buf[enemies.ys[:count], enemies.xs[:count]] = ord("E")
+    buf[player_y, player_x] = ord("@")
+
+    newlines = np.full((game_map.height, 1), ord("\n"), dtype=np.uint8)
+    rows = np.concatenate([buf, newlines], axis=1)
+    sys.stdout.write(rows.tobytes().decode("ascii"))
+
+def _flood(tiles: np.ndarray, visited: np.ndarray, sx: int, sy: int):
+    """Flood-fills the floor region containing (sx, sy) into ``visited``.
+
+    ``visited`` must be zeroed by the caller. Compiled with Numba when it
+    is installed.
+    """
+    height, width = tiles.shape
+    stack = np.empty(tiles.size, dtype=np.int32)
+    visited[sy, sx] = 1
+    stack[0] = sy * width + sx
+    top = 1
+
+    while top:
+        top -= 1
+        y, x = divmod(stack[top], width)
+
+        for dx, dy in _NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+
+            if 0 <= nx < width and 0 <= ny < height and \
+               not visited[ny, nx] and tiles[ny, nx] == FLOOR:
+
+                visited[ny, nx] = 1
+                stack[top] = ny * width + nx
+                top += 1
+
+if njit is not None:
+    _flood = njit(cache=True)(_flood)
 
 def check_map_connectivity(game_map: GameMap, rooms: list[Rect]) -> bool:
-    """Check if all rooms on the map are connected using BFS."""
+    """Check if all rooms on the map are connected.
+
+    Uses connected-component labelling of the floor tiles when SciPy is
+    available, a compiled flood fill when Numba is, and otherwise a BFS
+    from the first room's center.
+    """
     if not rooms:
         return True
 
-    start_node = rooms[0]
-    start_pos = ((start_node.x1 + start_node.x2) // 2, (start_node.y1 + start_node.y2) // 2)
+    xs = np.array([room.cx for room in rooms])
+    ys = np.array([room.cy for room in rooms])
 
-    q = deque([start_pos])
-    visited = {start_pos}
+    if label is not None:
+        labels, _ = label(game_map.tiles == FLOOR)
+        ids = labels[ys, xs]
+        return bool(ids[0] != 0 and (ids == ids[0]).all())
+
+    visited = game_map._visited
+    visited.fill(0)
 
-    room_centers = set()
-    for room in rooms:
-        center = ((room.x1 + room.x2) // 2, (room.y1 + room.y2) // 2)
-        room_centers.add(center)
+    if njit is not None:
+        _flood(game_map.tiles, visited, xs[0], ys[0])
+        return bool(visited[ys, xs].all())
 
-    found_centers = set()
-    if start_pos in room_centers:
-        found_centers.add(start_pos)
+    start_pos = (int(xs[0]), int(ys[0]))
+    q = deque([start_pos])
+    visited[start_pos[1], start_pos[0]] = 1
+
+    # Bind everything the inner loop touches to locals.
+    tiles = game_map.tiles
+    width = game_map.width
+    height = game_map.height
+    floor = FLOOR
+    neighbours = _NEIGHBOURS
 
     while q:
         x, y = q.popleft()
 
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+        for dx, dy in neighbours:
             nx, ny = x + dx, y + dy
 
-            if 0 <= nx < game_map.width and 0 <= ny < game_map.height and \
-               (nx, ny) not in visited and game_map.tiles[ny][nx] == TileType.FLOOR:
+            if 0 <= nx < width and 0 <= ny < height and \
+               not visited[ny, nx] and tiles[ny, nx] == floor:
 
-                visited.add((nx, ny))
+                visited[ny, nx] = 1
                 q.append((nx, ny))
 
-                if (nx, ny) in room_centers:
-                    found_centers.add((nx, ny))
+    return bool(visited[ys, xs].all())
 
-    return len(found_centers) == len(room_centers)
+def _enemy_table(enemy_types: dict) -> tuple[tuple[str, ...], tuple[tuple[str, int, int, int], ...]]:
+    """Flattens enemy types into parallel tuples of ids and (name, hp, atk, def)."""
+    enemy_ids = tuple(enemy_types)
+    enemy_stats = tuple(
+        (enemy_types[enemy_id]["name"], enemy_types[enemy_id]["hp"],
+         enemy_types[enemy_id]["atk"], enemy_types[enemy_id]["def"])
+        for enemy_id in enemy_ids
+    )
+    return enemy_ids, enemy_stats
 
-def _place_enemies(rng: RNG, rooms: list[Rect], enemy_types: dict) -> list[Enemy]:
+def _place_enemies(rng: RNG, rooms: list[Rect], enemy_ids: tuple[str, ...], enemy_stats: tuple[tuple[str, int, int, int], ...], width: int) -> list[Enemy]:
     enemies = []
-    if not rooms:
+    if not rooms or not enemy_ids:
         return enemies
 
     player_start_room = rooms[0]
-    player_start_pos = (
-        (player_start_room.x1 + player_start_room.x2) // 2,
-        (player_start_room.y1 + player_start_room.y2) // 2,
-    )
 
-    for room in rooms:
-        # Try to place one enemy per room, avoiding the player's start tile.
-        for _ in range(5):  # 5 attempts to find a valid spot
-            x = rng.randint(room.x1 + 1, room.x2 - 1)
-            y = rng.randint(room.y1 + 1, room.y2 - 1)
+    # Draw all 5 candidate spots for every room in one go, packed as y * width + x.
+    bounds = np.array([[room.x1 + 1, room.x2 - 1, room.y1 + 1, room.y2 - 1] for room in rooms])
+    xs = rng.randints(bounds[:, 0], bounds[:, 1], size=(5, len(rooms)))
+    ys = rng.randints(bounds[:, 2], bounds[:, 3], size=(5, len(rooms)))
+    candidates = (ys * width + xs).T.tolist()
 
-            if (x, y) == player_start_pos:
-                continue
+    # The player's start tile is never a valid spawn.
+    taken = {player_start_room.cy * width + player_start_room.cx}
 
-            if any(enemy.x == x and enemy.y == y for enemy in enemies):
+    for room_candidates in candidates:
+        # Try to place one enemy per room, avoiding occupied tiles.
+        for pos in room_candidates:
+            if pos in taken:
                 continue
+            taken.add(pos)
 
-            enemy_id = rng.choice(list(enemy_types.keys()))
-            enemy_data = enemy_types[enemy_id]
+            y, x = divmod(pos, width)
+            type_i = rng.randint(0, len(enemy_ids) - 1)
+            name, hp, atk, def_stat = enemy_stats[type_i]
             enemy = Enemy(
                 x=x,
                 y=y,
-                enemy_id=enemy_id,
-                name=enemy_data["name"],
-                hp=enemy_data["hp"],
-                atk=enemy_data["atk"],
-                def_stat=enemy_data["def"],
+                enemy_id=enemy_ids[type_i],
+                name=name,
+                hp=hp,
+                atk=atk,
+                def_stat=def_stat,
             )
             enemies.append(enemy)
             break  # Move to the next room after placing one enemy
     return enemies
 
-
-def generate_map(rng: RNG, width: int, height: int, max_rooms: int, min_room_size: int, max_room_size: int, enemy_types: dict) -> tuple[GameMap, list[Rect], list[Enemy]]:
-    """Generates a new map with rooms and corridors."""
-    while True:
-        game_map = GameMap(width, height)
-        rooms = []
-
-        for _ in range(max_rooms):
-            w = rng.randint(min_room_size, max_room_size)
-            h = rng.randint(min_room_size, max_room_size)
-            x = rng.randint(0, width - w - 1)
-            y = rng.randint(0, height - h - 1)
-
-            new_room = Rect(x, y, w, h)
-
-            # Check for intersections
-            if any((new_room.x1 <= room.x2 and new_room.x2 >= room.x1 and \
-                    new_room.y1 <= room.y2 and new_room.y2 >= room.y1) for room in rooms):
+def make_generator(width: int, height: int, max_rooms: int, min_room_size: int, max_room_size: int):
+    """Returns a map generator specialized for one set of map parameters.
+
+    The parameters are bound once, so callers don't repeat them for every
+    level they generate.
+    """
+    def generate(rng: RNG, enemy_types: dict) -> tuple[GameMap, list[Rect], list[Enemy]]:
+        """Generates a new map with rooms and corridors."""
+        enemy_ids, enemy_stats = _enemy_table(enemy_types)
+
+        while True:
+            rooms = []
+            # Floor rectangles for this attempt, carved in one pass once all rooms are placed.
+            stamps = []
+            # (x1, y1, x2, y2) of each placed room. With at most a few dozen
+            # rooms, plain int compares beat numpy's per-call overhead.
+            bounds = []
+
+            for _ in range(max_rooms):
+                w = rng.randint(min_room_size, max_room_size)
+                h = rng.randint(min_room_size, max_room_size)
+                x = rng.randint(0, width - w - 1)
+                y = rng.randint(0, height - h - 1)
+                x2 = x + w
+                y2 = y + h
+
+                # Check for intersections before building the room
+                if any(x <= bx2 and x2 >= bx1 and y <= by2 and y2 >= by1
+                       for bx1, by1, bx2, by2 in bounds):
+                    continue
+
+                new_room = Rect(x, y, w, h)
+                stamps.append(_room_stamp(new_room))
+
+                if rooms:
+                    prev_room = rooms[-1]
+
+                    if rng.randint(0, 1) == 1:
+                        # Horizontal then vertical
+                        stamps.append(_h_tunnel_stamp(prev_room.cx, new_room.cx, prev_room.cy))
+                        stamps.append(_v_tunnel_stamp(prev_room.cy, new_room.cy, new_room.cx))
+                    else:
+                        # Vertical then horizontal
+                        stamps.append(_v_tunnel_stamp(prev_room.cy, new_room.cy, prev_room.cx))
+                        stamps.append(_h_tunnel_stamp(prev_room.cx, new_room.cx, new_room.cy))
+
+                rooms.append(new_room)
+                bounds.append((x, y, x2, y2))
+
+            game_map = GameMap(width, height)
+            _apply_stamps(game_map, stamps)
+
+            # Every room is tunnelled to the previous one, so a single check once
+            # the map is complete is enough; retry the whole map if it fails.
+            if not check_map_connectivity(game_map, rooms):
                 continue
 
-            _create_room(game_map, new_room)
-
-            if rooms:
-                prev_room = rooms[-1]
-                # Center points of the rooms
-                prev_center_x = (prev_room.x1 + prev_room.x2) // 2
-                prev_center_y = (prev_room.y1 + prev_room.y2) // 2
-                new_center_x = (new_room.x1 + new_room.x2) // 2
-                new_center_y = (new_room.y1 + new_room.y2) // 2
+            enemies = _place_enemies(rng, rooms, enemy_ids, enemy_stats, width)
+            return game_map, rooms, enemies
 
-                if rng.randint(0, 1) == 1:
-                    # Horizontal then vertical
-                    _create_h_tunnel(game_map, prev_center_x, new_center_x, prev_center_y)
-                    _create_v_tunnel(game_map, prev_center_y, new_center_y, new_center_x)
-                else:
-                    # Vertical then horizontal
-                    _create_v_tunnel(game_map, prev_center_y, new_center_y, prev_center_x)
-                    _create_h_tunnel(game_map, prev_center_x, new_center_x, new_center_y)
+    return generate
 
-            rooms.append(new_room)
-
-            if check_map_connectivity(game_map, rooms):
-                enemies = _place_enemies(rng, rooms, enemy_types)
-                return game_map, rooms, enemies
+def generate_map(rng: RNG, width: int, height: int, max_rooms: int, min_room_size: int, max_room_size: int, enemy_types: dict) -> tuple[GameMap, list[Rect], list[Enemy]]:
+    """Generates a new map with rooms and corridors."""
+    return make_generator(width, height, max_rooms, min_room_size, max_room_size)(rng, enemy_types)
 
 def load_game(filename: str) -> Engine:
     """Loads a game state from a file."""
@@ -303,15 +513,8 @@ def load_game(filename: str) -> Engine:
 
     rng = RNG(data["seed"])
 
-    # Map parameters
-    map_width = 80
-    map_height = 45
-    max_rooms = 30
-    min_room_size = 6
-    max_room_size = 10
-
-    # TODO: this will regen the map, we should save and load the map state
-    game_map, _, _ = generate_map(rng, map_width, map_height, max_rooms, min_room_size, max_room_size, {})
+    map_data = data["map"]
+    game_map = GameMap.unpack(map_data["width"], map_data["height"], base64.b64decode(map_data["tiles"]))
 
     player_data = data["player"]
     player = Player(player_data["x"], player_data["y"], player_data["hp"])
@@ -356,20 +559,15 @@ def main():
                 print(f"Invalid seed: {sys.argv[1]}. Using a random seed.")
         rng = RNG(seed)
 
-        # Map parameters
-        map_width = 80
-        map_height = 45
-        max_rooms = 30
-        min_room_size = 6
-        max_room_size = 10
-
-        game_map, rooms, enemies = generate_map(rng, map_width, map_height, max_rooms, min_room_size, max_room_size, enemy_types)
+        # Map parameters: width, height, max rooms, min and max room size.
+        generate_level = make_generator(80, 45, 30, 6, 10)
+        game_map, rooms, enemies = generate_level(rng, enemy_types)
 
         player_x, player_y = 0, 0
         if rooms:
             first_room = rooms[0]
-            player_x = (first_room.x1 + first_room.x2) // 2
-            player_y = (first_room.y1 + first_room.y2) // 2
+            player_x = first_room.cx
+            player_y = first_room.cy
 
         player = Player(player_x, player_y)
         engine = Engine(rng, game_map, player, enemies, enemy_types)
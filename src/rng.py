@@ -1,17 +1,40 @@
-import random
+import secrets
+
+import numpy as np
+
+# Scalar draws are served from a block of raw 63-bit values, since one numpy
+# call per draw costs several times more than random.Random.randint.
+_BLOCK_SIZE = 1024
+# Ranges up to this size reduce a raw value by modulo, with a bias below 2**-31.
+_MAX_BUFFERED_SPAN = 2**32
 
 class RNG:
     def __init__(self, seed=None):
         if seed is None:
-            seed = random.getrandbits(32)
+            seed = secrets.randbits(64)
         self.seed = seed
-        self._random = random.Random(seed)
+        # PCG64 only takes non-negative seeds; fold any int into 64 bits.
+        self._generator = np.random.Generator(np.random.PCG64(seed % 2**64))
+        self._block = []
 
     def randint(self, a, b):
-        return self._random.randint(a, b)
+        span = b - a + 1
+        if span <= 0:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        if span > _MAX_BUFFERED_SPAN:
+            return int(self._generator.integers(a, b + 1))
+        if not self._block:
+            self._block = self._generator.integers(0, 2**63, size=_BLOCK_SIZE).tolist()
+        return a + self._block.pop() % span
+
+    def randints(self, a, b, size):
+        """Draws ``size`` ints in [a, b] at once; ``a`` and ``b`` may be arrays."""
+        return self._generator.integers(a, b + 1, size=size)
 
     def choice(self, seq):
-        return self._random.choice(seq)
+        if len(seq) == 0:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randint(0, len(seq) - 1)]
 
     def shuffle(self, seq):
-        self._random.shuffle(seq)
\ No newline at end of file
+        self._generator.shuffle(seq)
\ No newline at end of file
@@ -0,0 +1,92 @@
+import io
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Add src to path to allow for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import engine_core
+from engine_core import GameMap, Rect, Enemy, EnemyStore, STAIRS_DOWN, check_map_connectivity, render_map, _create_room, _create_h_tunnel
+
+class TestMapConnectivity(unittest.TestCase):
+    def _two_rooms(self):
+        game_map = GameMap(30, 10)
+        rooms = [Rect(1, 1, 5, 5), Rect(20, 1, 5, 5)]
+        for room in rooms:
+            _create_room(game_map, room)
+        return game_map, rooms
+
+    def test_connectivity_backends(self):
+        # engine_core only compiles _flood when SciPy is missing, so build the
+        # flood-fill backend here: Numba-compiled if installed, else plain Python.
+        py_flood = getattr(engine_core._flood, "py_func", engine_core._flood)
+        if njit is not None:
+            flood_backend = (None, njit, njit(py_flood))
+        else:
+            flood_backend = (None, mock.sentinel.njit, py_flood)
+
+        # SciPy labelling, flood fill, and the plain Python BFS.
+        backends = [(engine_core.label, None, py_flood), flood_backend, (None, None, py_flood)]
+        for label, jit, flood in backends:
+            with mock.patch.object(engine_core, "label", label), \
+                 mock.patch.object(engine_core, "njit", jit), \
+                 mock.patch.object(engine_core, "_flood", flood):
+                game_map, rooms = self._two_rooms()
+                self.assertFalse(check_map_connectivity(game_map, rooms))
+
+                _create_h_tunnel(game_map, 3, 22, 3)
+                self.assertTrue(check_map_connectivity(game_map, rooms))
+
+class TestPackedTiles(unittest.TestCase):
+    def test_pack_round_trip(self):
+        # 7 x 3 is not a multiple of 4 cells, so the last byte is padded.
+        game_map = GameMap(7, 3)
+        _create_room(game_map, Rect(0, 0, 5, 2))
+        game_map.tiles[1, 5] = STAIRS_DOWN
+
+        data = game_map.pack()
+        restored = GameMap.unpack(7, 3, data)
+
+        self.assertEqual(len(data), 6)
+        self.assertTrue(np.array_equal(restored.tiles, game_map.tiles))
+
+class TestRenderMap(unittest.TestCase):
+    def test_render_map(self):
+        game_map = GameMap(5, 3)
+        _create_room(game_map, Rect(0, 0, 4, 2))
+        enemies = EnemyStore([Enemy(3, 1, "rat_mutant", "Mutant Rat", 8, 3, 0)])
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            render_map(game_map, 1, 1, enemies)
+
+        self.assertEqual(out.getvalue(), "#####\n#@.E#\n#####\n")
+
+class TestEnemyStore(unittest.TestCase):
+    def test_remove_keeps_position_index(self):
+        store = EnemyStore([
+            Enemy(1, 1, "rat_mutant", "Mutant Rat", 8, 3, 0),
+            Enemy(2, 1, "rat_mutant", "Mutant Rat", 8, 3, 0),
+            Enemy(3, 1, "scavenger", "Scavenger", 12, 4, 1),
+        ])
+
+        store.remove(store[store.pos_index[(1, 1)]])
+
+        self.assertEqual(len(store), 2)
+        self.assertNotIn((1, 1), store.pos_index)
+        moved = store[store.pos_index[(3, 1)]]
+        self.assertEqual((moved.enemy_id, moved.name, moved.hp), ("scavenger", "Scavenger", 12))
+        self.assertEqual(sorted((enemy.x, enemy.y) for enemy in store), [(2, 1), (3, 1)])
+
+if __name__ == '__main__':
+    unittest.main()
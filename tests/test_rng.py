@@ -2,6 +2,8 @@ import unittest
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path to allow for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -17,7 +19,37 @@ class TestRNG(unittest.TestCase):
         map1, _, _ = generate_map(rng1, 20, 10, 5, 3, 5, {})
         map2, _, _ = generate_map(rng2, 20, 10, 5, 3, 5, {})
 
-        self.assertEqual(map1.tiles, map2.tiles, "Maps generated with the same seed should be identical")
+        self.assertTrue(np.array_equal(map1.tiles, map2.tiles), "Maps generated with the same seed should be identical")
+
+    def test_negative_seed(self):
+        map1, _, _ = generate_map(RNG(-5), 20, 10, 5, 3, 5, {})
+        map2, _, _ = generate_map(RNG(-5), 20, 10, 5, 3, 5, {})
+
+        self.assertEqual(RNG(-5).seed, -5)
+        self.assertTrue(np.array_equal(map1.tiles, map2.tiles))
+
+    def test_randint_matches_seed_and_bounds(self):
+        rng1 = RNG(42)
+        rng2 = RNG(42)
+
+        # More draws than one buffered block, across several ranges.
+        draws1 = [rng1.randint(3, 3 + i % 7) for i in range(3000)]
+        draws2 = [rng2.randint(3, 3 + i % 7) for i in range(3000)]
+
+        self.assertEqual(draws1, draws2)
+        self.assertTrue(all(3 <= d <= 3 + i % 7 for i, d in enumerate(draws1)))
+        self.assertEqual(set(draws1[6::7]), set(range(3, 10)))
+
+    def test_randints_matches_seed_and_bounds(self):
+        lows = np.array([0, 10, 20])
+        highs = np.array([5, 10, 25])
+
+        draws1 = RNG(42).randints(lows, highs, size=(100, 3))
+        draws2 = RNG(42).randints(lows, highs, size=(100, 3))
+
+        self.assertTrue(np.array_equal(draws1, draws2))
+        self.assertTrue(((draws1 >= lows) & (draws1 <= highs)).all())
+        self.assertTrue((draws1[:, 1] == 10).all())
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,10 +2,14 @@ import unittest
 import os
 import sys
 from pathlib import Path
+from unittest import mock
+
+import numpy as np
 
 # Add src to path to allow for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import engine_core
 from engine_core import Engine, Player, GameMap, RNG, save_game, load_game, generate_map
 
 class TestSaveLoad(unittest.TestCase):
@@ -35,7 +39,25 @@ class TestSaveLoad(unittest.TestCase):
         self.assertEqual(self.engine.player.y, loaded_engine.player.y)
         self.assertEqual(self.engine.player.hp, loaded_engine.player.hp)
         self.assertEqual(self.engine.player.inventory, loaded_engine.player.inventory)
-        self.assertEqual(self.engine.game_map.tiles, loaded_engine.game_map.tiles)
+        self.assertTrue(np.array_equal(self.engine.game_map.tiles, loaded_engine.game_map.tiles))
+
+    def test_save_without_orjson(self):
+        with mock.patch.object(engine_core, "orjson", None):
+            save_game(self.engine, self.save_file)
+
+        loaded_engine = load_game(self.save_file)
+
+        self.assertEqual(self.engine.seed, loaded_engine.seed)
+        self.assertTrue(np.array_equal(self.engine.game_map.tiles, loaded_engine.game_map.tiles))
+
+    def test_save_with_large_seed(self):
+        seed = 99999999999999999999999
+        engine = Engine(RNG(seed), self.game_map, Player(10, 10), [], {})
+        save_game(engine, self.save_file)
+
+        loaded_engine = load_game(self.save_file)
+
+        self.assertEqual(loaded_engine.seed, seed)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file